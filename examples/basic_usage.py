@@ -1,22 +1,33 @@
 #!/usr/bin/env python3
 """Example usage of libdyson-mqtt library."""
 
-import json
+import sys
 import time
 from datetime import datetime
 from typing import Any, Union
 
 from libdyson_mqtt import ConnectionConfig, DysonMqttClient
 
+# Encoded once up front; the client publishes bytes payloads as-is
+REQUEST_CURRENT_STATE = b'{"msg": "REQUEST-CURRENT-STATE"}'
+
+# The command schema is fixed, so fill in a template instead of building and encoding a dict.
+# Only safe for values that need no JSON escaping, such as command names and ISO timestamps.
+TIMED_COMMAND_TEMPLATE = '{{"msg":"{}","time":"{}"}}'
+
 
 def message_handler(message: Any) -> None:
     """Handle incoming MQTT messages."""
-    print(f"[{datetime.now().isoformat()}] Received message:")
-    print(f"  Topic: {message.topic}")
-    print(f"  Payload: {message.payload_str}")
-    print(f"  QoS: {message.qos}")
-    print(f"  Retained: {message.retain}")
-    print("---")
+    # Reuse the receive time captured by the library instead of reading the clock again,
+    # and emit the whole record with a single write; the polling loop flushes stdout
+    sys.stdout.write(
+        f"[{message.timestamp.isoformat()}] Received message:\n"
+        f"  Topic: {message.topic}\n"
+        f"  Payload: {message.payload_str}\n"
+        f"  QoS: {message.qos}\n"
+        f"  Retained: {message.retain}\n"
+        "---\n"
+    )
 
 
 def connection_handler(connected: bool, error: Union[str, None]) -> None:
@@ -48,10 +59,18 @@ def main() -> int:
     print("====================")
     print(f"Connecting to {config.host}...")
 
+    # Track the connection state locally, updated only when the client reports a change
+    connected = False
+
+    def on_connection_change(is_connected: bool, error: Union[str, None]) -> None:
+        nonlocal connected
+        connected = is_connected
+        connection_handler(is_connected, error)
+
     # Create client with callbacks
     client = DysonMqttClient(config)
     client.set_message_callback(message_handler)
-    client.set_connection_callback(connection_handler)
+    client.set_connection_callback(on_connection_change)
 
     try:
         # Connect to device
@@ -60,29 +79,36 @@ def main() -> int:
         # Wait a moment for connection to establish
         time.sleep(2)
 
-        if client.is_connected():
-            print("\\nSending status request...")
+        if connected:
+            print("\\nSending status requests...")
 
-            # Example command to request status
-            command = {"msg": "REQUEST-CURRENT-STATE", "time": datetime.now().isoformat()}
+            # Example commands to request status and sensor data, filled into a fixed JSON template
+            now = datetime.now().isoformat()
+            commands = [
+                TIMED_COMMAND_TEMPLATE.format(msg, now).encode()
+                for msg in ("REQUEST-CURRENT-STATE", "REQUEST-PRODUCT-ENVIRONMENT-CURRENT-SENSOR-DATA")
+            ]
 
-            client.publish("475/your_device/command", json.dumps(command))  # Replace with your device serial
+            # Send both commands in a single batch
+            command_topic = "475/your_device/command"  # Replace with your device serial
+            client.publish_many((command_topic, command, 2, False) for command in commands)
 
             print("\\nListening for messages (press Ctrl+C to stop)...")
 
             # Listen for messages for 30 seconds
-            start_time = time.time()
-            while time.time() - start_time < 30:
-                # Get any queued messages (in addition to callback)
-                messages = client.get_messages()
-                if messages:
+            deadline = time.monotonic() + 30
+            while (remaining := deadline - time.monotonic()) > 0:
+                # Wake as soon as messages arrive instead of sleeping a fixed interval
+                if client.wait_for_message(timeout=min(remaining, 1.0)):
+                    # Get any queued messages (in addition to callback)
+                    messages = client.get_messages()
                     print(f"Retrieved {len(messages)} messages from queue")
 
-                time.sleep(1)
+                # Flush buffered message output once per wakeup rather than once per message
+                sys.stdout.flush()
 
-                # Show connection status
-                status = client.get_status()
-                if not status.connected:
+                # Reconnect if the connection callback reported a loss
+                if not connected:
                     print("Connection lost, attempting to reconnect...")
                     client.connect()
                     time.sleep(2)
@@ -122,7 +148,7 @@ def example_context_manager() -> None:
             print("Connected via context manager")
 
             # Send a command
-            client.publish("475/your_device/command", '{"msg": "REQUEST-CURRENT-STATE"}')
+            client.publish("475/your_device/command", REQUEST_CURRENT_STATE)
 
             # Wait for responses
             time.sleep(5)
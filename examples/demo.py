@@ -3,13 +3,18 @@
 
 import logging
 import time
-from typing import Optional
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 from libdyson_mqtt import ConnectionConfig, DysonMqttClient, MqttMessage
 
 # Enable logging to see what's happening
 logging.basicConfig(level=logging.INFO)
 
+# Commands are encoded once up front; the client publishes bytes payloads as-is
+REQUEST_CURRENT_STATE = b'{"msg": "REQUEST-CURRENT-STATE"}'
+REQUEST_SENSOR_DATA = b'{"msg": "REQUEST-PRODUCT-ENVIRONMENT-CURRENT-SENSOR-DATA"}'
+
 
 def create_test_client() -> DysonMqttClient:
     """Create a test client with example configuration."""
@@ -26,65 +31,46 @@ def create_test_client() -> DysonMqttClient:
     return DysonMqttClient(config)
 
 
-def demo_basic_usage() -> None:
+def demo_basic_usage(client: DysonMqttClient) -> None:
     """Demonstrate basic usage patterns."""
     print("libdyson-mqtt Demo")
     print("==================")
 
-    client = create_test_client()
-
-    print("1. Basic connection and status check")
-    print(f"   Initial status: Connected = {client.is_connected()}")
-
-    try:
-        # Connect (this is non-blocking)
-        client.connect()
-        print("   Connection initiated...")
-
-        # Give it a moment to connect (in real usage, use callbacks)
-        time.sleep(2)
-
-        print(f"   Status after connect: Connected = {client.is_connected()}")
-
-        if client.is_connected():
-            print("   ✓ Connected successfully!")
-
-            # Demonstrate publishing
-            print("\\n2. Publishing a message")
-            try:
-                client.publish("475/device/command", '{"msg": "REQUEST-CURRENT-STATE"}')
-                print("   ✓ Message published")
-            except Exception as e:
-                print(f"   ✗ Publish failed: {e}")
-
-            # Check for any received messages
-            print("\\n3. Checking for received messages")
-            messages = client.get_messages()
-            print(f"   Found {len(messages)} messages in queue")
-
-            for i, msg in enumerate(messages, 1):
-                print(f"   Message {i}:")
-                print(f"     Topic: {msg.topic}")
-                print(f"     Payload: {msg.payload_str}")
-                print(f"     QoS: {msg.qos}")
-        else:
-            print("   ✗ Connection failed")
-            status = client.get_status()
-            print(f"   Error: {status.last_error}")
-
-    finally:
-        print("\\n4. Cleaning up")
-        client.disconnect()
-        print("   ✓ Disconnected cleanly")
-
-
-def demo_callbacks() -> None:
-    """Demonstrate callback functionality."""
-    print("\\n\\nCallback Demo")
-    print("=============")
-
-    received_messages = []
-    connection_events = []
+    print("1. Connection status check")
+    print(f"   Status after connect: Connected = {client.is_connected()}")
+
+    if client.is_connected():
+        print("   ✓ Connected successfully!")
+
+        # Demonstrate publishing
+        print("\\n2. Publishing a message")
+        try:
+            client.publish("475/device/command", REQUEST_CURRENT_STATE)
+            print("   ✓ Message published")
+        except Exception as e:
+            print(f"   ✗ Publish failed: {e}")
+
+        # Check for any received messages
+        print("\\n3. Checking for received messages")
+        messages = client.get_messages()
+        print(f"   Found {len(messages)} messages in queue")
+
+        for i, msg in enumerate(messages, 1):
+            print(f"   Message {i}:")
+            print(f"     Topic: {msg.topic}")
+            print(f"     Payload: {msg.payload_str}")
+            print(f"     QoS: {msg.qos}")
+    else:
+        print("   ✗ Connection failed")
+        status = client.get_status()
+        print(f"   Error: {status.last_error}")
+
+
+def register_callbacks(client: DysonMqttClient) -> Tuple[Deque[MqttMessage], List[Tuple[bool, Optional[str]]]]:
+    """Register demo callbacks, returning the buffers they record messages and connection events into."""
+    # Bounded so a chatty device can't grow memory without limit
+    received_messages: Deque[MqttMessage] = deque(maxlen=10_000)
+    connection_events: List[Tuple[bool, Optional[str]]] = []
 
     def on_message(message: MqttMessage) -> None:
         """Handle received messages."""
@@ -99,20 +85,29 @@ def demo_callbacks() -> None:
             print(f"❌ Connection lost: {error}")
         connection_events.append((connected, error))
 
-    client = create_test_client()
     client.set_message_callback(on_message)
     client.set_connection_callback(on_connection_change)
+    return received_messages, connection_events
 
-    try:
-        print("Connecting with callbacks enabled...")
-        client.connect()
 
-        # Wait for connection and any initial messages
-        time.sleep(5)
+def demo_callbacks(
+    client: DysonMqttClient,
+    received_messages: Deque[MqttMessage],
+    connection_events: List[Tuple[bool, Optional[str]]],
+) -> None:
+    """Demonstrate callback functionality."""
+    print("\\n\\nCallback Demo")
+    print("=============")
 
+    try:
         if client.is_connected():
-            # Send a command to generate some traffic
-            client.publish("475/device/command", '{"msg": "REQUEST-PRODUCT-ENVIRONMENT-CURRENT-SENSOR-DATA"}')
+            # Send a batch of commands to generate some traffic
+            client.publish_many(
+                [
+                    ("475/device/command", REQUEST_CURRENT_STATE, 2, False),
+                    ("475/device/command", REQUEST_SENSOR_DATA, 2, False),
+                ]
+            )
 
             # Wait for responses
             time.sleep(3)
@@ -121,37 +116,26 @@ def demo_callbacks() -> None:
         print(f"Connection events: {len(connection_events)}")
 
     finally:
-        client.disconnect()
+        # Leave the shared client as we found it for the remaining demos
+        client.set_message_callback(None)
+        client.set_connection_callback(None)
 
 
-def demo_context_manager() -> None:
-    """Demonstrate context manager usage."""
+def demo_context_manager(client: DysonMqttClient) -> None:
+    """Demonstrate using a client opened by a context manager."""
     print("\\n\\nContext Manager Demo")
     print("====================")
 
-    config = ConnectionConfig(
-        host="192.168.1.100",
-        mqtt_username="475",
-        mqtt_password="your_device_password",
-        mqtt_topics=["475/device/status"],
-    )
-
-    try:
-        # Context manager automatically handles connection/disconnection
-        with DysonMqttClient(config) as client:
-            print("✓ Connected via context manager")
-
-            # Use the client
-            client.publish("475/device/command", '{"msg": "REQUEST-CURRENT-STATE"}')
-            time.sleep(2)
-
-            messages = client.get_messages()
-            print(f"Received {len(messages)} messages")
+    # main() opened this client with a context manager, which disconnects it on exit
+    print(f"✓ Connected via context manager = {client.is_connected()}")
 
-    except Exception as e:
-        print(f"Error: {e}")
+    # Use the client
+    if client.is_connected():
+        client.publish("475/device/command", REQUEST_CURRENT_STATE)
+        time.sleep(2)
 
-    print("✓ Context manager automatically disconnected")
+    messages = client.get_messages()
+    print(f"Received {len(messages)} messages")
 
 
 def main() -> None:
@@ -160,9 +144,20 @@ def main() -> None:
     print("Note: You'll need to update the configuration with your device details.\\n")
 
     try:
-        demo_basic_usage()
-        demo_callbacks()
-        demo_context_manager()
+        client = create_test_client()
+        # Register callbacks before connecting so the connection event is reported
+        received_messages, connection_events = register_callbacks(client)
+
+        # Share one connection across the demos; the context manager connects and disconnects it
+        with client:
+            # Give it a moment to connect (in real usage, use callbacks)
+            time.sleep(2)
+
+            demo_basic_usage(client)
+            demo_callbacks(client, received_messages, connection_events)
+            demo_context_manager(client)
+
+        print("✓ Context manager automatically disconnected")
 
     except KeyboardInterrupt:
         print("\\n\\nDemo interrupted by user")
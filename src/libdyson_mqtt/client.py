@@ -1,11 +1,15 @@
 """MQTT client for communicating with Dyson devices."""
 
+import json
 import logging
+import queue
+import socket
 import threading
 import time
 import uuid
-from datetime import datetime
-from typing import Any, Callable, List, Optional, Union
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
 
 import paho.mqtt.client as mqtt
 from paho.mqtt.client import ConnectFlags, DisconnectFlags
@@ -22,15 +26,62 @@ from .models import ConnectionConfig, ConnectionStatus, MqttMessage
 
 logger = logging.getLogger(__name__)
 
+_Payload = Union[str, bytes, bytearray, int, float, None, Dict[str, Any]]
+
+# Logger method names for paho log levels, looked up on the module logger at call time
+_LOG_LEVEL_MAP: Dict[int, str] = {
+    mqtt.MQTT_LOG_DEBUG: "debug",
+    mqtt.MQTT_LOG_INFO: "info",
+    mqtt.MQTT_LOG_NOTICE: "info",
+    mqtt.MQTT_LOG_WARNING: "warning",
+    mqtt.MQTT_LOG_ERR: "error",
+}
+
+# Kernel socket buffer size used when low latency tuning is enabled
+_SOCKET_BUFFER_SIZE = 1 << 20
+
+
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    """Serialize a payload to compact UTF-8 JSON with the standard library.
+
+    NaN and infinity are rejected rather than published as invalid JSON.
+    """
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+_json_dumps: Callable[[Any], bytes] = _stdlib_json_dumps
+try:
+    # orjson serializes straight to bytes and is considerably faster than the stdlib
+    import orjson
+
+    # Match the stdlib: stringify non-str keys and reject datetimes instead of formatting them
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _orjson_dumps(obj: Any) -> bytes:
+        """Serialize a payload to compact UTF-8 JSON with orjson."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    _json_dumps = _orjson_dumps
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    pass
+
+
+def _reason_code_value(reason_code: Any) -> int:
+    """Return the numeric value of a ReasonCode, ConnackCode or plain integer reason code."""
+    return int(getattr(reason_code, "value", reason_code))
+
 
 class DysonMqttClient:
     """Non-blocking MQTT client for Dyson devices."""
 
-    def __init__(self, config: ConnectionConfig) -> None:
+    def __init__(self, config: ConnectionConfig, bounded: bool = True, max_queue_size: int = 1000) -> None:
         """Initialize the Dyson MQTT client.
 
         Args:
             config: Connection configuration for the Dyson device
+            bounded: Whether to cap the message queue, dropping the oldest messages when full.
+                An unbounded queue hands messages between threads without taking the client lock.
+            max_queue_size: Maximum number of queued messages when the queue is bounded
         """
         self._config = config
         self._client_id = config.client_id or f"dyson-mqtt-{uuid.uuid4().hex[:8]}"
@@ -43,12 +94,16 @@ class DysonMqttClient:
         self._connection_callback: Optional[Callable[[bool, Optional[str]], None]] = None
 
         # Message queue for non-blocking operations
-        self._message_queue: List[MqttMessage] = []
-        self._max_queue_size = 1000
-
-        self._setup_client()
-
-    def _setup_client(self) -> None:
+        self._message_queue: Deque[MqttMessage] = deque(maxlen=max_queue_size)
+        self._unbounded_queue: Optional["queue.SimpleQueue[MqttMessage]"] = None if bounded else queue.SimpleQueue()
+        # Messages already taken off the unbounded queue but kept by a peek. Consumers guard them and
+        # the drain with their own lock so a long drain never stalls the network thread on the client lock.
+        self._peeked_messages: List[MqttMessage] = []
+        self._consumer_lock = threading.Lock()
+        self._message_event = threading.Event()
+        self._queue_overflowing = False
+
+    def _setup_client(self) -> mqtt.Client:
         """Set up the MQTT client with callbacks."""
         self._client = mqtt.Client(callback_api_version=CallbackAPIVersion.VERSION2, client_id=self._client_id)
 
@@ -63,6 +118,8 @@ class DysonMqttClient:
         self._client.on_publish = self._on_publish
         self._client.on_log = self._on_log
 
+        return self._client
+
     def _on_connect(
         self,
         client: mqtt.Client,
@@ -82,28 +139,31 @@ class DysonMqttClient:
                 is_failure = reason_code.value != 0 if hasattr(reason_code, "value") else reason_code != 0
 
             if is_failure:
+                code_value = _reason_code_value(reason_code)
                 if hasattr(reason_code, "is_failure"):
                     # ReasonCode object - already has descriptive string representation
                     error_msg = f"Failed to connect to MQTT broker: {reason_code}"
                 else:
                     # ConnackCode or integer - use connack_string for descriptive messages
-                    code_value = reason_code.value if hasattr(reason_code, "value") else reason_code
                     error_msg = f"Failed to connect to MQTT broker: {mqtt.connack_string(code_value)}"
                 logger.error(error_msg)
                 self._status.connected = False
                 self._status.last_error = error_msg
+                self._status.last_error_code = code_value
                 self._status.connection_attempts += 1
 
                 if self._connection_callback:
                     try:
                         self._connection_callback(False, error_msg)
                     except Exception as e:
-                        logger.error(f"Error in connection callback: {e}")
+                        logger.error("Error in connection callback: %s", e)
             else:
-                logger.info(f"Connected to MQTT broker at {self._config.host}")
+                logger.info("Connected to MQTT broker at %s", self._config.host)
+                self._tune_socket(client)
                 self._status.connected = True
-                self._status.last_connect_time = datetime.now()
+                self._status.last_connect_time = datetime.now(timezone.utc)
                 self._status.last_error = None
+                self._status.last_error_code = None
 
                 # Subscribe to all configured topics
                 self._subscribe_to_topics()
@@ -113,7 +173,24 @@ class DysonMqttClient:
                     try:
                         self._connection_callback(True, None)
                     except Exception as e:
-                        logger.error(f"Error in connection callback: {e}")
+                        logger.error("Error in connection callback: %s", e)
+
+    def _tune_socket(self, client: mqtt.Client) -> None:
+        """Disable Nagle's algorithm and enlarge the socket buffers when low latency is configured."""
+        if not self._config.low_latency:
+            return
+
+        # Websocket transports wrap the socket and don't expose socket options
+        sock = client.socket()
+        if not isinstance(sock, socket.socket):
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+        except OSError as e:
+            logger.warning("Failed to tune MQTT socket: %s", e)
 
     def _on_disconnect(
         self,
@@ -125,9 +202,9 @@ class DysonMqttClient:
     ) -> None:
         """Handle disconnection events."""
         with self._lock:
-            logger.info(f"Disconnected from MQTT broker (reason: {reason_code})")
+            logger.info("Disconnected from MQTT broker (reason: %s)", reason_code)
             self._status.connected = False
-            self._status.last_disconnect_time = datetime.now()
+            self._status.last_disconnect_time = datetime.now(timezone.utc)
 
             # Handle different types of reason codes
             if hasattr(reason_code, "is_failure"):
@@ -140,13 +217,14 @@ class DysonMqttClient:
             if is_failure:
                 error_msg = f"Unexpected disconnection: {reason_code}"
                 self._status.last_error = error_msg
+                self._status.last_error_code = _reason_code_value(reason_code)
                 logger.warning(error_msg)
 
                 if self._connection_callback:
                     try:
                         self._connection_callback(False, error_msg)
                     except Exception as e:
-                        logger.error(f"Error in connection callback: {e}")
+                        logger.error("Error in connection callback: %s", e)
 
     def _on_message(self, client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage) -> None:
         """Handle incoming messages."""
@@ -159,60 +237,73 @@ class DysonMqttClient:
                 retain=msg.retain,
             )
 
-            logger.debug(f"Received message on topic {msg.topic}: {dyson_msg.payload_str}")
-
-            # Add to queue (non-blocking)
-            with self._lock:
-                if len(self._message_queue) >= self._max_queue_size:
-                    # Remove oldest message to prevent memory issues
-                    self._message_queue.pop(0)
-                    logger.warning("Message queue full, dropped oldest message")
+            # Only decode the payload when debug logging will actually emit it
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received message on topic %s: %s", msg.topic, dyson_msg.payload_str)
 
-                self._message_queue.append(dyson_msg)
+            self._enqueue_message(dyson_msg)
 
             # Call user callback if set
             if self._message_callback:
                 try:
                     self._message_callback(dyson_msg)
                 except Exception as e:
-                    logger.error(f"Error in message callback: {e}")
+                    logger.error("Error in message callback: %s", e)
 
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
+            logger.error("Error processing message: %s", e)
+
+    def _enqueue_message(self, message: MqttMessage) -> None:
+        """Add a message to the queue (non-blocking)."""
+        if self._unbounded_queue is not None:
+            # SimpleQueue.put is thread-safe on its own, so the client lock is not needed
+            self._unbounded_queue.put(message)
+            self._message_event.set()
+            return
+
+        with self._lock:
+            # A full deque drops its oldest entry on append to prevent memory issues
+            if len(self._message_queue) == self._message_queue.maxlen:
+                # Warn once per overflow rather than once per dropped message
+                if not self._queue_overflowing:
+                    self._queue_overflowing = True
+                    logger.warning("Message queue full, dropping oldest messages until it is drained")
+                self._status.dropped_messages += 1
+
+            self._message_queue.append(message)
+            self._message_event.set()
 
     def _on_subscribe(
         self, client: mqtt.Client, userdata: Any, mid: int, reason_code_list: Any, properties: Any = None
     ) -> None:
         """Handle subscription confirmations."""
-        logger.debug(f"Subscription confirmed (mid: {mid}, reason codes: {reason_code_list})")
+        logger.debug("Subscription confirmed (mid: %s, reason codes: %s)", mid, reason_code_list)
 
     def _on_publish(
         self, client: mqtt.Client, userdata: Any, mid: int, reason_code: Any = None, properties: Any = None
     ) -> None:
         """Handle publish confirmations."""
-        logger.debug(f"Message published (mid: {mid})")
+        logger.debug("Message published (mid: %s)", mid)
 
     def _on_log(self, client: mqtt.Client, userdata: Any, level: int, buf: str) -> None:
         """Handle MQTT client logging."""
-        if level <= mqtt.MQTT_LOG_WARNING:
-            logger.warning(f"MQTT: {buf}")
-        else:
-            logger.debug(f"MQTT: {buf}")
+        getattr(logger, _LOG_LEVEL_MAP.get(level, "debug"))("MQTT: %s", buf)
 
     def _subscribe_to_topics(self) -> None:
         """Subscribe to all configured topics."""
         if not self._client or not self._status.connected:
             return
 
-        for topic in self._config.mqtt_topics:
-            try:
-                result, mid = self._client.subscribe(topic, qos=2)  # QoS 2 for exactly once delivery
-                if result != mqtt.MQTT_ERR_SUCCESS:
-                    logger.error(f"Failed to subscribe to topic {topic}: {mqtt.error_string(result)}")
-                else:
-                    logger.info(f"Subscribed to topic: {topic}")
-            except Exception as e:
-                logger.error(f"Error subscribing to topic {topic}: {e}")
+        topics = self._config.mqtt_topics
+        try:
+            # A single SUBSCRIBE packet covers every topic; QoS 2 for exactly once delivery
+            result, mid = self._client.subscribe([(topic, 2) for topic in topics])
+            if result != mqtt.MQTT_ERR_SUCCESS:
+                logger.error("Failed to subscribe to topics %s: %s", topics, mqtt.error_string(result))
+            else:
+                logger.info("Subscribed to topics: %s", topics)
+        except Exception as e:
+            logger.error("Error subscribing to topics %s: %s", topics, e)
 
     def connect(self) -> None:
         """Connect to the MQTT broker (non-blocking).
@@ -220,20 +311,20 @@ class DysonMqttClient:
         Raises:
             ConnectionError: If the connection attempt fails
         """
-        if not self._client:
-            raise ConnectionError("MQTT client not initialized")
-
         with self._lock:
             if self._status.connected:
                 logger.warning("Already connected to MQTT broker")
                 return
 
             try:
-                logger.info(f"Connecting to MQTT broker at {self._config.host}:{self._config.port}")
-                self._client.connect_async(self._config.host, self._config.port, self._config.keepalive)
+                # The paho client is only created once a connection is actually needed
+                client = self._client or self._setup_client()
+
+                logger.info("Connecting to MQTT broker at %s:%s", self._config.host, self._config.port)
+                client.connect_async(self._config.host, self._config.port, self._config.keepalive)
 
                 # Start the network loop in a separate thread
-                self._client.loop_start()
+                client.loop_start()
 
             except Exception as e:
                 error_msg = f"Failed to initiate connection: {e}"
@@ -259,12 +350,12 @@ class DysonMqttClient:
                     self._client.disconnect()
 
                     # Wait for disconnect with timeout
-                    start_time = time.time()
-                    while self._status.connected and (time.time() - start_time) < timeout:
+                    deadline = time.monotonic() + timeout
+                    while self._status.connected and time.monotonic() < deadline:
                         time.sleep(0.1)  # Short sleep to allow disconnect processing
 
                     if self._status.connected:
-                        logger.warning(f"Disconnect timed out after {timeout}s, forcing cleanup")
+                        logger.warning("Disconnect timed out after %ss, forcing cleanup", timeout)
                         self._status.connected = False  # Force status update
 
                 # Stop the network loop
@@ -277,12 +368,12 @@ class DysonMqttClient:
             # This prevents Home Assistant integration reload from hanging
             logger.warning("Continuing cleanup despite disconnect error")
 
-    def publish(self, topic: str, payload: Union[str, bytes], qos: int = 2, retain: bool = False) -> None:
+    def publish(self, topic: str, payload: _Payload, qos: int = 2, retain: bool = False) -> None:
         """Publish a message to a topic (non-blocking).
 
         Args:
             topic: The MQTT topic to publish to
-            payload: The message payload
+            payload: The message payload; str is UTF-8 encoded and dicts are serialized to JSON
             qos: Quality of Service level (0, 1, or 2)
             retain: Whether the message should be retained by the broker
 
@@ -290,6 +381,28 @@ class DysonMqttClient:
             ClientNotConnectedError: If not connected to the broker
             TopicError: If the publish fails
         """
+        client = self._ensure_connected()
+        self._publish(client, topic, payload, qos, retain)
+
+    def publish_many(self, messages: Iterable[Tuple[str, _Payload, int, bool]]) -> None:
+        """Publish a batch of messages (non-blocking).
+
+        The connection state is checked once for the whole batch and the
+        messages are handed to the MQTT client back-to-back, in order.
+
+        Args:
+            messages: Iterable of (topic, payload, qos, retain) tuples
+
+        Raises:
+            ClientNotConnectedError: If not connected to the broker
+            TopicError: If publishing any message fails; later messages are not sent
+        """
+        client = self._ensure_connected()
+        for topic, payload, qos, retain in messages:
+            self._publish(client, topic, payload, qos, retain)
+
+    def _ensure_connected(self) -> mqtt.Client:
+        """Return the underlying MQTT client, raising if it cannot currently publish."""
         if not self._client:
             raise ClientNotConnectedError("MQTT client not initialized")
 
@@ -297,18 +410,25 @@ class DysonMqttClient:
             if not self._status.connected:
                 raise ClientNotConnectedError("Not connected to MQTT broker")
 
+        return self._client
+
+    def _publish(self, client: mqtt.Client, topic: str, payload: _Payload, qos: int, retain: bool) -> None:
+        """Hand a single message to the MQTT client."""
         try:
+            # Binary payloads, numbers and None (an empty payload) are passed through to paho untouched
             if isinstance(payload, str):
                 payload = payload.encode("utf-8")
+            elif isinstance(payload, dict):
+                payload = _json_dumps(payload)
 
-            result, mid = self._client.publish(topic, payload, qos, retain)
+            result, mid = client.publish(topic, payload, qos, retain)
 
             if result != mqtt.MQTT_ERR_SUCCESS:
                 error_msg = f"Failed to publish to topic {topic}: {mqtt.error_string(result)}"
                 logger.error(error_msg)
                 raise TopicError(error_msg)
             else:
-                logger.debug(f"Published message to topic {topic} (mid: {mid})")
+                logger.debug("Published message to topic %s (mid: %s)", topic, mid)
 
         except Exception as e:
             if isinstance(e, (ClientNotConnectedError, TopicError)):
@@ -326,11 +446,79 @@ class DysonMqttClient:
         Returns:
             List of received MQTT messages
         """
+        if self._unbounded_queue is not None:
+            return self._drain_unbounded_queue(self._unbounded_queue, clear_queue)
+
         with self._lock:
-            messages = self._message_queue.copy()
-            if clear_queue:
-                self._message_queue.clear()
-            return messages
+            if not clear_queue:
+                return list(self._message_queue)
+
+            # Swap in an empty queue so the lock is held for O(1) regardless of backlog
+            messages, self._message_queue = self._message_queue, deque(maxlen=self._message_queue.maxlen)
+            self._message_event.clear()
+            self._queue_overflowing = False
+
+        return list(messages)
+
+    def _drain_unbounded_queue(
+        self, message_queue: "queue.SimpleQueue[MqttMessage]", clear_queue: bool
+    ) -> List[MqttMessage]:
+        """Drain the unbounded queue behind any previously peeked messages.
+
+        Peeked messages stay in a consumer-side buffer instead of being put back, so a peek never
+        reorders them relative to messages that producers add concurrently.
+        """
+        # The consumer lock only serializes consumers; producers put without it
+        with self._consumer_lock:
+            # Clear first so a message put during the drain signals again
+            self._message_event.clear()
+            messages = self._peeked_messages
+            try:
+                while True:
+                    messages.append(message_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if not clear_queue:
+                if messages:
+                    self._message_event.set()
+                return list(messages)
+
+            self._peeked_messages = []
+
+        return messages
+
+    def _has_messages(self) -> bool:
+        """Check whether any messages are waiting to be retrieved."""
+        if self._unbounded_queue is not None:
+            return bool(self._peeked_messages) or not self._unbounded_queue.empty()
+        return bool(self._message_queue)
+
+    def wait_for_message(self, timeout: Optional[float] = None) -> bool:
+        """Block until messages are queued or the timeout expires.
+
+        Args:
+            timeout: Maximum time to wait (seconds), or None to wait indefinitely
+
+        Returns:
+            True if messages are waiting in the queue, False if the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._message_event.wait(None if deadline is None else max(deadline - time.monotonic(), 0)):
+            with self._consumer_lock:
+                if self._has_messages():
+                    return True
+
+                # A producer may signal after its message was already drained; re-arm and check
+                # again so a message added between the two checks is not missed
+                self._message_event.clear()
+                if self._has_messages():
+                    self._message_event.set()
+                    return True
+
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+        return False
 
     def set_message_callback(self, callback: Optional[Callable[[MqttMessage], None]]) -> None:
         """Set callback for received messages.
@@ -361,6 +549,8 @@ class DysonMqttClient:
                 last_disconnect_time=self._status.last_disconnect_time,
                 connection_attempts=self._status.connection_attempts,
                 last_error=self._status.last_error,
+                last_error_code=self._status.last_error_code,
+                dropped_messages=self._status.dropped_messages,
             )
 
     def is_connected(self) -> bool:
@@ -1,8 +1,10 @@
 """Models for the libdyson_mqtt library."""
 
+import sys
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 @dataclass
@@ -16,17 +18,20 @@ class MqttMessage:
     timestamp: Optional[datetime] = None
 
     def __post_init__(self) -> None:
-        """Ensure timestamp is set if not provided."""
+        """Intern the topic and ensure timestamp is set if not provided."""
+        # Topics repeat constantly, so share one string object per topic for cheap hashing and comparison
+        self.topic = sys.intern(self.topic)
         if self.timestamp is None:
-            self.timestamp = datetime.now()
+            self.timestamp = datetime.now(timezone.utc)
 
-    @property
+    @cached_property
     def payload_str(self) -> str:
-        """Get the payload as a UTF-8 decoded string."""
+        """Get the payload as a UTF-8 decoded string, decoded on first access."""
         return self.payload.decode("utf-8", errors="replace")
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the message to a dictionary."""
+    @cached_property
+    def _dict(self) -> Dict[str, Any]:
+        """Get the dictionary form of the message, built on first access."""
         return {
             "topic": self.topic,
             "payload": self.payload_str,
@@ -35,6 +40,24 @@ class MqttMessage:
             "timestamp": self.timestamp.isoformat() if self.timestamp else None,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the message to a dictionary.
+
+        The dictionary is built once per message; each call returns a shallow copy so callers may modify it.
+        """
+        return dict(self._dict)
+
+
+# (attribute, predicate, error message) checks applied in order by ConnectionConfig
+_CONFIG_VALIDATORS: Tuple[Tuple[str, Callable[[Any], bool], str], ...] = (
+    ("host", bool, "Host cannot be empty"),
+    ("mqtt_username", bool, "MQTT username cannot be empty"),
+    ("mqtt_password", bool, "MQTT password cannot be empty"),
+    ("mqtt_topics", bool, "MQTT topics list cannot be empty"),
+    ("port", lambda port: 1 <= port <= 65535, "Port must be between 1 and 65535"),
+    ("keepalive", lambda keepalive: keepalive >= 1, "Keepalive must be positive"),
+)
+
 
 @dataclass
 class ConnectionConfig:
@@ -47,21 +70,13 @@ class ConnectionConfig:
     port: int = 1883
     keepalive: int = 60
     client_id: Optional[str] = None
+    low_latency: bool = False
 
     def __post_init__(self) -> None:
         """Validate configuration parameters."""
-        if not self.host:
-            raise ValueError("Host cannot be empty")
-        if not self.mqtt_username:
-            raise ValueError("MQTT username cannot be empty")
-        if not self.mqtt_password:
-            raise ValueError("MQTT password cannot be empty")
-        if not self.mqtt_topics:
-            raise ValueError("MQTT topics list cannot be empty")
-        if self.port < 1 or self.port > 65535:
-            raise ValueError("Port must be between 1 and 65535")
-        if self.keepalive < 1:
-            raise ValueError("Keepalive must be positive")
+        for attr, is_valid, message in _CONFIG_VALIDATORS:
+            if not is_valid(getattr(self, attr)):
+                raise ValueError(message)
 
 
 @dataclass
@@ -73,6 +88,8 @@ class ConnectionStatus:
     last_disconnect_time: Optional[datetime] = None
     connection_attempts: int = 0
     last_error: Optional[str] = None
+    last_error_code: Optional[int] = None
+    dropped_messages: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert status to dictionary."""
@@ -82,4 +99,6 @@ class ConnectionStatus:
             "last_disconnect_time": self.last_disconnect_time.isoformat() if self.last_disconnect_time else None,
             "connection_attempts": self.connection_attempts,
             "last_error": self.last_error,
+            "last_error_code": self.last_error_code,
+            "dropped_messages": self.dropped_messages,
         }
@@ -1,11 +1,16 @@
 """Test fixtures for the test suite."""
 
+from typing import Any, Callable, Iterator, Tuple
+from unittest.mock import MagicMock, patch
+
+import paho.mqtt.client as mqtt  # type: ignore
 import pytest
 
-from libdyson_mqtt import ConnectionConfig
+from libdyson_mqtt import ConnectionConfig, DysonMqttClient
+from libdyson_mqtt import client as client_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config() -> ConnectionConfig:
     """Provide a sample connection configuration for testing."""
     return ConnectionConfig(
@@ -17,3 +22,38 @@ def sample_config() -> ConnectionConfig:
         keepalive=60,
         client_id="test_client",
     )
+
+
+@pytest.fixture(scope="module")
+def mock_mqtt_client() -> Iterator[MagicMock]:
+    """Patch the paho MQTT client class once per test module.
+
+    Tests share the patched class, so each test should call ``reset_mock()`` before use.
+    """
+    with patch("libdyson_mqtt.client.mqtt.Client") as mock_client_class:
+        yield mock_client_class
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def json_dumps(request: pytest.FixtureRequest) -> Callable[[Any], bytes]:
+    """Provide each JSON serializer backend used for dict payloads, skipping orjson when not installed."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        return client_module._orjson_dumps  # type: ignore[attr-defined]
+    return client_module._stdlib_json_dumps
+
+
+@pytest.fixture
+def patched_client(sample_config: ConnectionConfig) -> Tuple[DysonMqttClient, MagicMock]:
+    """Provide a connected client wired to a mock paho MQTT client instance.
+
+    Publish and subscribe on the mock instance succeed by default; tests override them as needed.
+    """
+    mock_client_instance = MagicMock()
+    mock_client_instance.publish.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+    mock_client_instance.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+
+    client = DysonMqttClient(sample_config)
+    client._client = mock_client_instance
+    client._status.connected = True
+    return client, mock_client_instance
@@ -4,8 +4,9 @@ These tests use a mock MQTT broker to test the full client functionality.
 """
 
 import json
+from types import SimpleNamespace
 from typing import Optional
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock
 
 import paho.mqtt.client as mqtt  # type: ignore[import-untyped]
 import pytest
@@ -14,7 +15,7 @@ from paho.mqtt.client import ConnackCode  # type: ignore[import-untyped]
 from libdyson_mqtt import ConnectionConfig, DysonMqttClient, MqttMessage
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def integration_config() -> ConnectionConfig:
     """Configuration for integration testing."""
     return ConnectionConfig(
@@ -31,7 +32,7 @@ def integration_config() -> ConnectionConfig:
 class TestDysonMqttClientIntegration:
     """Integration tests for the complete client workflow."""
 
-    def test_client_lifecycle(self, integration_config: ConnectionConfig) -> None:
+    def test_client_lifecycle(self, integration_config: ConnectionConfig, mock_mqtt_client: MagicMock) -> None:
         """Test the complete client lifecycle with mocked MQTT."""
         messages_received = []
         connection_events = []
@@ -42,151 +43,180 @@ class TestDysonMqttClientIntegration:
         def connection_callback(connected: bool, error: Optional[str]) -> None:
             connection_events.append((connected, error))
 
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            # Setup mock MQTT client
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
+        mock_mqtt_client.reset_mock()
 
-            # Mock successful connection
-            mock_client_instance.connect_async.return_value = 0
+        # Setup mock MQTT client
+        mock_client_instance = Mock()
+        mock_mqtt_client.return_value = mock_client_instance
 
-            # Mock subscribe and publish methods to return expected tuples
-            mock_client_instance.subscribe.return_value = (0, 1)  # (result, mid)
-            mock_client_instance.publish.return_value = (0, 1)  # (result, mid)
-            # Mock publish and subscribe methods to return expected tuples
-            mock_client_instance.publish.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
-            mock_client_instance.publish.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
-            mock_client_instance.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+        # Mock successful connection
+        mock_client_instance.connect_async.return_value = 0
 
-            # Create client
-            client = DysonMqttClient(integration_config)
-            client.set_message_callback(message_callback)
-            client.set_connection_callback(connection_callback)
+        # Mock subscribe and publish methods to return expected tuples
+        mock_client_instance.subscribe.return_value = (0, 1)  # (result, mid)
+        mock_client_instance.publish.return_value = (0, 1)  # (result, mid)
+        # Mock publish and subscribe methods to return expected tuples
+        mock_client_instance.publish.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+        mock_client_instance.publish.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+        mock_client_instance.subscribe.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
 
-            # Test connection
-            client.connect()
+        # Create client
+        client = DysonMqttClient(integration_config)
+        client.set_message_callback(message_callback)
+        client.set_connection_callback(connection_callback)
 
-            # Simulate successful connection
-            client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
+        # Test connection
+        client.connect()
 
-            assert client.is_connected()
+        # Simulate successful connection
+        client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
 
-            # Verify subscriptions were attempted
-            expected_calls = len(integration_config.mqtt_topics)
-            assert mock_client_instance.subscribe.call_count == expected_calls
+        assert client.is_connected()
 
-            # Simulate receiving a message
-            mock_message = Mock()
-            mock_message.topic = "test/device/status"
-            mock_message.payload = b'{"status": "active", "temperature": 22.5}'
-            mock_message.qos = 2
-            mock_message.retain = False
+        # Verify all topics were subscribed with a single call
+        assert mock_client_instance.subscribe.call_count == 1
+        subscriptions = mock_client_instance.subscribe.call_args.args[0]
+        assert subscriptions == [(topic, 2) for topic in integration_config.mqtt_topics]
 
-            client._on_message(mock_client_instance, None, mock_message)
+        # Simulate receiving a message
+        mock_message = SimpleNamespace(
+            topic="test/device/status", payload=b'{"status": "active", "temperature": 22.5}', qos=2, retain=False
+        )
+
+        client._on_message(mock_client_instance, None, mock_message)
 
-            # Verify message was processed
-            assert len(messages_received) == 1
-            received_msg = messages_received[0]
-            assert received_msg.topic == "test/device/status"
-            assert received_msg.payload_str == '{"status": "active", "temperature": 22.5}'
+        # Verify message was processed
+        assert len(messages_received) == 1
+        received_msg = messages_received[0]
+        assert received_msg.topic == "test/device/status"
+        assert received_msg.payload_str == '{"status": "active", "temperature": 22.5}'
 
-            # Test publishing
-            client.publish("test/device/command", '{"command": "power_on"}')
-            mock_client_instance.publish.assert_called_once()
+        # Test publishing
+        client.publish("test/device/command", '{"command": "power_on"}')
+        mock_client_instance.publish.assert_called_once()
 
-            # Test clean disconnect
-            client.disconnect()
-            mock_client_instance.disconnect.assert_called_once()
+        # Test clean disconnect
+        client.disconnect()
+        mock_client_instance.disconnect.assert_called_once()
 
-    def test_message_queue_functionality(self, integration_config: ConnectionConfig) -> None:
+    def test_message_queue_functionality(
+        self, integration_config: ConnectionConfig, mock_mqtt_client: MagicMock
+    ) -> None:
         """Test message queuing without callbacks."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
-
-            client = DysonMqttClient(integration_config)
-            client.connect()
-            client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
-
-            # Simulate multiple messages
-            for i in range(3):
-                mock_message = Mock()
-                mock_message.topic = f"test/device/status/{i}"
-                mock_message.payload = json.dumps({"msg_id": i}).encode()
-                mock_message.qos = 2
-                mock_message.retain = False
-
-                client._on_message(mock_client_instance, None, mock_message)
-
-            # Get messages from queue
-            messages = client.get_messages()
-            assert len(messages) == 3
-
-            # Verify messages are in order
-            for i, msg in enumerate(messages):
-                assert msg.topic == f"test/device/status/{i}"
-                payload_data = json.loads(msg.payload_str)
-                assert payload_data["msg_id"] == i
-
-            # Queue should be empty after retrieval
-            messages = client.get_messages()
-            assert len(messages) == 0
-
-    def test_connection_error_handling(self, integration_config: ConnectionConfig) -> None:
+        mock_mqtt_client.reset_mock()
+
+        mock_client_instance = Mock()
+        mock_mqtt_client.return_value = mock_client_instance
+
+        client = DysonMqttClient(integration_config)
+        client.connect()
+        client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
+
+        # Simulate multiple messages
+        for i in range(3):
+            mock_message = SimpleNamespace(
+                topic=f"test/device/status/{i}", payload=json.dumps({"msg_id": i}).encode(), qos=2, retain=False
+            )
+
+            client._on_message(mock_client_instance, None, mock_message)
+
+        # Get messages from queue
+        messages = client.get_messages()
+        assert len(messages) == 3
+
+        # Verify messages are in order
+        for i, msg in enumerate(messages):
+            assert msg.topic == f"test/device/status/{i}"
+            payload_data = json.loads(msg.payload_str)
+            assert payload_data["msg_id"] == i
+
+        # Queue should be empty after retrieval
+        messages = client.get_messages()
+        assert len(messages) == 0
+
+    def test_connection_error_handling(self, integration_config: ConnectionConfig, mock_mqtt_client: MagicMock) -> None:
         """Test handling of connection errors."""
         connection_events = []
 
         def connection_callback(connected: bool, error: Optional[str]) -> None:
             connection_events.append((connected, error))
 
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
+        mock_mqtt_client.reset_mock()
 
-            client = DysonMqttClient(integration_config)
-            client.set_connection_callback(connection_callback)
+        mock_client_instance = Mock()
+        mock_mqtt_client.return_value = mock_client_instance
 
-            client.connect()
+        client = DysonMqttClient(integration_config)
+        client.set_connection_callback(connection_callback)
 
-            # Simulate connection failure
-            client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_REFUSED_NOT_AUTHORIZED)
+        client.connect()
 
-            assert not client.is_connected()
+        # Simulate connection failure
+        client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_REFUSED_NOT_AUTHORIZED)
 
-            # Verify error was captured
-            status = client.get_status()
-            assert not status.connected
-            assert status.last_error is not None
-            assert "Failed to connect" in status.last_error
+        assert not client.is_connected()
 
-    def test_message_queue_overflow(self, integration_config: ConnectionConfig) -> None:
+        # Verify error was captured
+        status = client.get_status()
+        assert not status.connected
+        assert status.last_error is not None
+        assert "Failed to connect" in status.last_error
+        assert status.last_error_code == ConnackCode.CONNACK_REFUSED_NOT_AUTHORIZED
+
+    def test_message_queue_overflow(self, integration_config: ConnectionConfig, mock_mqtt_client: MagicMock) -> None:
         """Test message queue overflow handling."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
-
-            client = DysonMqttClient(integration_config)
-            client._max_queue_size = 5  # Set small queue for testing
-
-            client.connect()
-            client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
-
-            # Send more messages than queue can hold
-            for i in range(10):
-                mock_message = Mock()
-                mock_message.topic = f"test/overflow/{i}"
-                mock_message.payload = f"message_{i}".encode()
-                mock_message.qos = 2
-                mock_message.retain = False
-
-                client._on_message(mock_client_instance, None, mock_message)
-
-            # Should only have the last 5 messages (oldest dropped)
-            messages = client.get_messages()
-            assert len(messages) == 5
-
-            # Should have messages 5-9 (0-4 were dropped)
-            for i, msg in enumerate(messages):
-                expected_id = i + 5
-                assert msg.topic == f"test/overflow/{expected_id}"
-                assert msg.payload_str == f"message_{expected_id}"
+        mock_mqtt_client.reset_mock()
+
+        mock_client_instance = Mock()
+        mock_mqtt_client.return_value = mock_client_instance
+
+        # Use a small queue for testing
+        client = DysonMqttClient(integration_config, bounded=True, max_queue_size=5)
+
+        client.connect()
+        client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
+
+        # Send more messages than queue can hold
+        for i in range(10):
+            mock_message = SimpleNamespace(
+                topic=f"test/overflow/{i}", payload=f"message_{i}".encode(), qos=2, retain=False
+            )
+
+            client._on_message(mock_client_instance, None, mock_message)
+
+        # Should only have the last 5 messages (oldest dropped)
+        assert client.get_status().dropped_messages == 5
+        messages = client.get_messages()
+        assert len(messages) == 5
+
+        # Should have messages 5-9 (0-4 were dropped)
+        for i, msg in enumerate(messages):
+            expected_id = i + 5
+            assert msg.topic == f"test/overflow/{expected_id}"
+            assert msg.payload_str == f"message_{expected_id}"
+
+    def test_unbounded_message_queue(self, integration_config: ConnectionConfig, mock_mqtt_client: MagicMock) -> None:
+        """Test an unbounded queue keeps every message in order."""
+        mock_mqtt_client.reset_mock()
+
+        mock_client_instance = Mock()
+        mock_mqtt_client.return_value = mock_client_instance
+
+        client = DysonMqttClient(integration_config, bounded=False)
+        client.connect()
+        client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
+
+        # Send more messages than the default bounded queue would hold
+        message_count = 1010
+        for i in range(message_count):
+            mock_message = SimpleNamespace(topic=f"test/unbounded/{i}", payload=b"", qos=2, retain=False)
+            client._on_message(mock_client_instance, None, mock_message)
+
+        # Peeking leaves the messages queued
+        assert len(client.get_messages(clear_queue=False)) == message_count
+        assert client.wait_for_message(timeout=0)
+
+        messages = client.get_messages()
+        assert [msg.topic for msg in messages] == [f"test/unbounded/{i}" for i in range(message_count)]
+        assert client.get_messages() == []
+        assert not client.wait_for_message(timeout=0)
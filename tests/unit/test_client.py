@@ -1,6 +1,7 @@
 """Unit tests for the client module."""
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
@@ -18,15 +19,34 @@ class TestDysonMqttClient:
         assert not client.is_connected()
         assert client._config == sample_config
 
-    def test_context_manager(self, sample_config: ConnectionConfig) -> None:
+        # The paho client is not created until connect()
+        assert client._client is None
+
+    def test_connect_creates_client_once(self, sample_config: ConnectionConfig, mock_mqtt_client: MagicMock) -> None:
+        """Test the MQTT client is created on first connect and then reused."""
+        mock_mqtt_client.reset_mock()
+
+        mock_client_instance = Mock()
+        mock_mqtt_client.return_value = mock_client_instance
+
+        client = DysonMqttClient(sample_config)
+        client.connect()
+        client.connect()
+
+        mock_mqtt_client.assert_called_once()
+        assert client._client is mock_client_instance
+        assert mock_client_instance.connect_async.call_count == 2
+
+    def test_context_manager(self, sample_config: ConnectionConfig, mock_mqtt_client: MagicMock) -> None:
         """Test client as context manager."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
+        mock_mqtt_client.reset_mock()
 
-            # Test context manager entry and exit
-            with DysonMqttClient(sample_config) as client:
-                assert client is not None
+        mock_client_instance = Mock()
+        mock_mqtt_client.return_value = mock_client_instance
+
+        # Test context manager entry and exit
+        with DysonMqttClient(sample_config) as client:
+            assert client is not None
 
     def test_publish_when_not_connected(self, sample_config: ConnectionConfig) -> None:
         """Test publishing when not connected raises exception."""
@@ -72,3 +92,51 @@ class TestDysonMqttClient:
         # Clear the callback
         client.set_connection_callback(None)
         assert client._connection_callback is None
+
+    def test_get_messages_without_clearing(self, sample_config: ConnectionConfig) -> None:
+        """Test peeking at queued messages leaves the queue intact."""
+        client = DysonMqttClient(sample_config)
+        client._on_message(
+            Mock(), None, SimpleNamespace(topic="test/topic", payload=b"test payload", qos=2, retain=False)
+        )
+
+        assert len(client.get_messages(clear_queue=False)) == 1
+        assert len(client.get_messages()) == 1
+        assert client.get_messages() == []
+
+    def test_wait_for_message(self, sample_config: ConnectionConfig) -> None:
+        """Test waiting for messages to be queued."""
+        client = DysonMqttClient(sample_config)
+
+        # Times out while the queue is empty
+        assert client.wait_for_message(timeout=0) is False
+
+        client._on_message(
+            Mock(), None, SimpleNamespace(topic="test/topic", payload=b"test payload", qos=2, retain=False)
+        )
+        assert client.wait_for_message(timeout=0) is True
+
+        # Draining the queue resets the signal
+        client.get_messages()
+        assert client.wait_for_message(timeout=0) is False
+
+    def test_unbounded_peek_preserves_order(self, sample_config: ConnectionConfig) -> None:
+        """Test peeking an unbounded queue keeps earlier messages ahead of later arrivals."""
+        client = DysonMqttClient(sample_config, bounded=False)
+
+        client._on_message(Mock(), None, SimpleNamespace(topic="test/first", payload=b"", qos=2, retain=False))
+        assert [msg.topic for msg in client.get_messages(clear_queue=False)] == ["test/first"]
+
+        client._on_message(Mock(), None, SimpleNamespace(topic="test/second", payload=b"", qos=2, retain=False))
+        assert [msg.topic for msg in client.get_messages()] == ["test/first", "test/second"]
+        assert client.wait_for_message(timeout=0) is False
+
+    def test_wait_for_message_ignores_stale_signal(self, sample_config: ConnectionConfig) -> None:
+        """Test a signal left behind for an already drained message does not report a message."""
+        client = DysonMqttClient(sample_config, bounded=False)
+
+        # A producer can set the event after a consumer has already drained its message
+        client._message_event.set()
+
+        assert client.wait_for_message(timeout=0) is False
+        assert not client._message_event.is_set()
@@ -1,13 +1,19 @@
 """Additional unit tests to improve code coverage."""
 
-from unittest.mock import Mock, patch
+import socket
+from dataclasses import replace
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Callable, Optional, Tuple
+from unittest.mock import MagicMock, Mock, call, patch
 
 import paho.mqtt.client as mqtt  # type: ignore
 import pytest
 from paho.mqtt.client import ConnackCode, DisconnectFlags  # type: ignore[import-untyped]
 
 from libdyson_mqtt import ConnectionConfig, DysonMqttClient
-from libdyson_mqtt.exceptions import ConnectionError, TopicError
+from libdyson_mqtt.client import _stdlib_json_dumps
+from libdyson_mqtt.exceptions import ClientNotConnectedError, ConnectionError, TopicError
 
 
 class TestDysonMqttClientCoverage:
@@ -29,69 +35,61 @@ class TestDysonMqttClientCoverage:
             # Verify callback was called with success
             callback.assert_called_once_with(True, None)
 
-    def test_connection_callback_with_failure(self, sample_config: ConnectionConfig) -> None:
-        """Test connection callback is called on connection failure."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
-
-            client = DysonMqttClient(sample_config)
-            callback = Mock()
-            client.set_connection_callback(callback)
-
-            # Simulate connection failure
-            client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_REFUSED_NOT_AUTHORIZED)
-
-            # Verify callback was called with failure (using the actual error message)
-            expected_msg = "Failed to connect to MQTT broker: Connection Refused: not authorised."
-            callback.assert_called_once_with(False, expected_msg)
-
-    def test_connection_callback_exception_handling(self, sample_config: ConnectionConfig) -> None:
-        """Test that exceptions in connection callbacks are handled gracefully."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
-
-            client = DysonMqttClient(sample_config)
-
-            # Create a callback that raises an exception
-            callback = Mock(side_effect=Exception("Callback error"))
-            client.set_connection_callback(callback)
-
-            with patch("libdyson_mqtt.client.logger") as mock_logger:
-                # Simulate successful connection - should handle callback exception
-                client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
-
-                # Verify error was logged
-                mock_logger.error.assert_called_with("Error in connection callback: Callback error")
-
-    def test_message_callback_exception_handling(self, sample_config: ConnectionConfig) -> None:
-        """Test that exceptions in message callbacks are handled gracefully."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
+    def test_status_times_are_utc(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
+        """Test connection status times are timezone-aware UTC, matching message timestamps."""
+        client, mock_client_instance = patched_client
+
+        client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
+        client._on_message(
+            mock_client_instance, None, SimpleNamespace(topic="test/topic", payload=b"", qos=1, retain=False)
+        )
+        client._on_disconnect(mock_client_instance, None, DisconnectFlags(False), ConnackCode.CONNACK_ACCEPTED)
+
+        status = client.get_status()
+        message = client.get_messages()[0]
+        assert status.last_connect_time is not None and status.last_disconnect_time is not None
+        assert status.last_connect_time.tzinfo is timezone.utc
+        assert status.last_disconnect_time.tzinfo is timezone.utc
+        assert status.last_connect_time <= message.timestamp <= status.last_disconnect_time
+
+    def test_low_latency_socket_tuning(self, sample_config: ConnectionConfig) -> None:
+        """Test socket options are tuned on connect when low latency is enabled."""
+        client = DysonMqttClient(replace(sample_config, low_latency=True))
+        mock_client_instance = Mock()
+        mock_socket = Mock(spec=socket.socket)
+        mock_client_instance.socket.return_value = mock_socket
+
+        client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
+
+        mock_socket.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        mock_socket.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        mock_socket.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+
+    def test_socket_not_tuned_by_default(self, sample_config: ConnectionConfig) -> None:
+        """Test socket options are left alone when low latency is disabled."""
+        client = DysonMqttClient(sample_config)
+        mock_client_instance = Mock()
 
-            client = DysonMqttClient(sample_config)
+        client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
 
-            # Create a callback that raises an exception
-            callback = Mock(side_effect=Exception("Message callback error"))
-            client.set_message_callback(callback)
+        mock_client_instance.socket.assert_not_called()
 
-            # Create a mock MQTT message
-            mock_msg = Mock()
-            mock_msg.topic = "test/topic"
-            mock_msg.payload = b"test payload"
-            mock_msg.qos = 1
+    def test_socket_tuning_error(self, sample_config: ConnectionConfig) -> None:
+        """Test socket tuning failures are logged rather than raised."""
+        client = DysonMqttClient(replace(sample_config, low_latency=True))
+        mock_client_instance = Mock()
+        mock_socket = Mock(spec=socket.socket)
+        mock_socket.setsockopt.side_effect = OSError("Option not supported")
+        mock_client_instance.socket.return_value = mock_socket
 
-            with patch("libdyson_mqtt.client.logger") as mock_logger:
-                # Simulate message arrival - should handle callback exception
-                client._on_message(mock_client_instance, None, mock_msg)
+        with patch("libdyson_mqtt.client.logger") as mock_logger:
+            client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_ACCEPTED)
 
-                # Verify error was logged
-                mock_logger.error.assert_called_with("Error in message callback: Message callback error")
+            mock_logger.warning.assert_called_with("Failed to tune MQTT socket: %s", mock_socket.setsockopt.side_effect)
+        assert client.is_connected()
 
-    def test_on_disconnect_with_unexpected_disconnect(self, sample_config: ConnectionConfig) -> None:
-        """Test disconnect handler with unexpected disconnection."""
+    def test_connection_callback_with_failure(self, sample_config: ConnectionConfig) -> None:
+        """Test connection callback is called on connection failure."""
         with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
             mock_client_instance = Mock()
             mock_mqtt_client.return_value = mock_client_instance
@@ -100,112 +98,126 @@ class TestDysonMqttClientCoverage:
             callback = Mock()
             client.set_connection_callback(callback)
 
-            # Set initial connection status
-            client._status.connected = True
-
-            # Simulate unexpected disconnect (non-zero return code)
-            disconnect_flags = DisconnectFlags(False)
-            # Create a simple object that behaves like a reason code with value != 0
-
-            class MockDisconnectReason:
-
-                def __init__(self, value: int) -> None:
-                    self.value = value
-
-                def __str__(self) -> str:
-                    return f"MockDisconnectReason({self.value})"
-
-            disconnect_reason = MockDisconnectReason(mqtt.MQTT_ERR_CONN_LOST)
-            client._on_disconnect(mock_client_instance, None, disconnect_flags, disconnect_reason)
-
-            # Verify status updated and callback called
-            assert not client._status.connected
-            assert client._status.last_error == f"Unexpected disconnection: {disconnect_reason}"
-            callback.assert_called_once_with(False, f"Unexpected disconnection: {disconnect_reason}")
-
-    def test_on_disconnect_callback_exception(self, sample_config: ConnectionConfig) -> None:
-        """Test disconnect callback exception handling."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
-
-            client = DysonMqttClient(sample_config)
-
-            # Create a callback that raises an exception
-            callback = Mock(side_effect=Exception("Disconnect callback error"))
-            client.set_connection_callback(callback)
+            # Simulate connection failure
+            client._on_connect(mock_client_instance, None, {}, ConnackCode.CONNACK_REFUSED_NOT_AUTHORIZED)
 
-            client._status.connected = True
+            # Verify callback was called with failure and the reason code was recorded
+            code = ConnackCode.CONNACK_REFUSED_NOT_AUTHORIZED.value
+            callback.assert_called_once_with(False, f"Failed to connect to MQTT broker: {mqtt.connack_string(code)}")
+            assert client.get_status().last_error_code == code
+
+    @pytest.mark.parametrize(
+        "register, trigger, log_msg",
+        [
+            pytest.param(
+                lambda client, callback: client.set_connection_callback(callback),
+                lambda client, mqtt_client: client._on_connect(mqtt_client, None, {}, ConnackCode.CONNACK_ACCEPTED),
+                "Error in connection callback: %s",
+                id="connect",
+            ),
+            pytest.param(
+                lambda client, callback: client.set_connection_callback(callback),
+                lambda client, mqtt_client: client._on_disconnect(
+                    mqtt_client, None, DisconnectFlags(False), SimpleNamespace(value=mqtt.MQTT_ERR_CONN_LOST)
+                ),
+                "Error in connection callback: %s",
+                id="disconnect",
+            ),
+            pytest.param(
+                lambda client, callback: client.set_message_callback(callback),
+                lambda client, mqtt_client: client._on_message(
+                    mqtt_client, None, SimpleNamespace(topic="test/topic", payload=b"test payload", qos=1, retain=False)
+                ),
+                "Error in message callback: %s",
+                id="message",
+            ),
+        ],
+    )
+    def test_callback_exception_handling(
+        self,
+        patched_client: Tuple[DysonMqttClient, MagicMock],
+        register: Callable[[DysonMqttClient, Mock], None],
+        trigger: Callable[[DysonMqttClient, MagicMock], None],
+        log_msg: str,
+    ) -> None:
+        """Test that exceptions raised by user callbacks are logged rather than propagated."""
+        client, mock_client_instance = patched_client
+        callback = Mock(side_effect=Exception("Callback error"))
+        register(client, callback)
 
-            with patch("libdyson_mqtt.client.logger") as mock_logger:
-                # Simulate unexpected disconnect
-                disconnect_flags = DisconnectFlags(False)
+        with patch("libdyson_mqtt.client.logger") as mock_logger:
+            trigger(client, mock_client_instance)
 
-                class MockDisconnectReason:
+            mock_logger.error.assert_called_with(log_msg, callback.side_effect)
 
-                    def __init__(self, value: int) -> None:
-                        self.value = value
+    def test_on_disconnect_with_unexpected_disconnect(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
+        """Test disconnect handler with unexpected disconnection."""
+        client, mock_client_instance = patched_client
 
-                    def __str__(self) -> str:
-                        return f"MockDisconnectReason({self.value})"
+        callback = Mock()
+        client.set_connection_callback(callback)
 
-                disconnect_reason = MockDisconnectReason(mqtt.MQTT_ERR_CONN_LOST)
-                client._on_disconnect(mock_client_instance, None, disconnect_flags, disconnect_reason)
+        # Simulate unexpected disconnect (non-zero return code)
+        disconnect_flags = DisconnectFlags(False)
+        # Create a simple object that behaves like a reason code with value != 0
+        disconnect_reason = SimpleNamespace(value=mqtt.MQTT_ERR_CONN_LOST)
+        client._on_disconnect(mock_client_instance, None, disconnect_flags, disconnect_reason)
 
-                # Verify error was logged
-                mock_logger.error.assert_called_with("Error in connection callback: Disconnect callback error")
+        # Verify status updated and callback called
+        assert not client._status.connected
+        assert client._status.last_error == f"Unexpected disconnection: {disconnect_reason}"
+        assert client._status.last_error_code == mqtt.MQTT_ERR_CONN_LOST
+        callback.assert_called_once_with(False, f"Unexpected disconnection: {disconnect_reason}")
 
     def test_subscribe_topics_when_not_connected(self, sample_config: ConnectionConfig) -> None:
         """Test subscribing to topics when not connected."""
         client = DysonMqttClient(sample_config)
+        client._client = Mock()
 
         # Ensure client is not connected
         assert not client.is_connected()
 
         # Should return early without subscribing to any topics
-        with patch.object(client._client, "subscribe") as mock_subscribe:
-            client._subscribe_to_topics()
+        client._subscribe_to_topics()
 
-            # Should not have called subscribe since not connected
-            mock_subscribe.assert_not_called()
+        # Should not have called subscribe since not connected
+        client._client.subscribe.assert_not_called()
 
-    def test_subscribe_topics_with_errors(self, sample_config: ConnectionConfig) -> None:
+    def test_subscribe_topics_with_errors(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
         """Test topic subscription error handling."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
+        client, mock_client_instance = patched_client
 
-            # Mock subscribe to return error
-            mock_client_instance.subscribe.return_value = (mqtt.MQTT_ERR_NO_CONN, 1)
+        # Mock subscribe to return error
+        mock_client_instance.subscribe.return_value = (mqtt.MQTT_ERR_NO_CONN, 1)
 
-            client = DysonMqttClient(sample_config)
-            client._client = mock_client_instance
-            client._status.connected = True
-
-            with patch("libdyson_mqtt.client.logger") as mock_logger:
-                client._subscribe_to_topics()
+        with patch("libdyson_mqtt.client.logger") as mock_logger:
+            client._subscribe_to_topics()
 
-                # Should log error for each topic
-                assert mock_logger.error.call_count >= 1
+            # Should log the subscription error
+            assert mock_logger.error.call_count >= 1
 
-    def test_subscribe_topics_with_exception(self, sample_config: ConnectionConfig) -> None:
+    def test_subscribe_topics_with_exception(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
         """Test topic subscription with exception."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
+        client, mock_client_instance = patched_client
 
-            # Mock subscribe to raise exception
-            mock_client_instance.subscribe.side_effect = Exception("Subscribe error")
+        # Mock subscribe to raise exception
+        mock_client_instance.subscribe.side_effect = Exception("Subscribe error")
 
-            client = DysonMqttClient(sample_config)
-            client._client = mock_client_instance
-            client._status.connected = True
+        with patch("libdyson_mqtt.client.logger") as mock_logger:
+            client._subscribe_to_topics()
 
-            with patch("libdyson_mqtt.client.logger") as mock_logger:
-                client._subscribe_to_topics()
+            # Should log error for exception
+            mock_logger.error.assert_called()
 
-                # Should log error for exception
-                mock_logger.error.assert_called()
+    def test_connect_with_client_setup_exception(self, sample_config: ConnectionConfig) -> None:
+        """Test connect method when creating the MQTT client fails."""
+        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
+            mock_mqtt_client.side_effect = Exception("Client setup failed")
+
+            client = DysonMqttClient(sample_config)
+
+            with pytest.raises(ConnectionError, match="Failed to initiate connection"):
+                client.connect()
 
     def test_connect_with_exception(self, sample_config: ConnectionConfig) -> None:
         """Test connect method when client setup fails."""
@@ -221,66 +233,45 @@ class TestDysonMqttClientCoverage:
             with pytest.raises(ConnectionError, match="Failed to initiate connection"):
                 client.connect()
 
-    def test_disconnect_with_exception(self, sample_config: ConnectionConfig) -> None:
+    def test_disconnect_with_exception(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
         """Test disconnect method when disconnection fails."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
+        client, mock_client_instance = patched_client
 
-            # Mock disconnect to raise exception
-            mock_client_instance.disconnect.side_effect = Exception("Disconnect failed")
+        # Mock disconnect to raise exception
+        mock_client_instance.disconnect.side_effect = Exception("Disconnect failed")
 
-            client = DysonMqttClient(sample_config)
-            client._client = mock_client_instance
-            client._status.connected = True
-
-            # Should not raise exception anymore - just log warning
-            client.disconnect()
+        # Should not raise exception anymore - just log warning
+        client.disconnect()
 
-            # Verify that it logged the error but didn't crash
-            mock_client_instance.disconnect.assert_called_once()
+        # Verify that it logged the error but didn't crash
+        mock_client_instance.disconnect.assert_called_once()
 
-    def test_publish_with_mqtt_error(self, sample_config: ConnectionConfig) -> None:
+    def test_publish_with_mqtt_error(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
         """Test publish method when MQTT publish fails."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
-
-            # Mock publish to return error
-            mock_client_instance.publish.return_value = (mqtt.MQTT_ERR_NO_CONN, 1)
+        client, mock_client_instance = patched_client
 
-            client = DysonMqttClient(sample_config)
-            client._client = mock_client_instance
-            client._status.connected = True
+        # Mock publish to return error
+        mock_client_instance.publish.return_value = (mqtt.MQTT_ERR_NO_CONN, 1)
 
-            with pytest.raises(TopicError, match="Failed to publish to topic"):
-                client.publish("test/topic", "test message")
+        with pytest.raises(TopicError, match="Failed to publish to topic"):
+            client.publish("test/topic", "test message")
 
-    def test_publish_with_exception(self, sample_config: ConnectionConfig) -> None:
+    def test_publish_with_exception(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
         """Test publish method when an exception occurs."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
-
-            # Mock publish to raise exception
-            mock_client_instance.publish.side_effect = Exception("Publish failed")
+        client, mock_client_instance = patched_client
 
-            client = DysonMqttClient(sample_config)
-            client._client = mock_client_instance
-            client._status.connected = True
+        # Mock publish to raise exception
+        mock_client_instance.publish.side_effect = Exception("Publish failed")
 
-            with pytest.raises(TopicError, match="Error publishing to topic"):
-                client.publish("test/topic", "test message")
+        with pytest.raises(TopicError, match="Error publishing to topic"):
+            client.publish("test/topic", "test message")
 
     def test_on_message_processing_error(self, sample_config: ConnectionConfig) -> None:
         """Test message processing error handling."""
         client = DysonMqttClient(sample_config)
 
         # Create a malformed message that will cause processing error
-        mock_msg = Mock()
-        mock_msg.topic = "test/topic"
-        mock_msg.payload = b"test payload"
-        mock_msg.qos = 1
+        mock_msg = SimpleNamespace(topic="test/topic", payload=b"test payload", qos=1, retain=False)
 
         with patch("libdyson_mqtt.client.MqttMessage") as mock_mqtt_message:
             # Make MqttMessage constructor raise an exception
@@ -290,7 +281,7 @@ class TestDysonMqttClientCoverage:
                 client._on_message(Mock(), None, mock_msg)
 
                 # Should log the processing error
-                mock_logger.error.assert_called_with("Error processing message: Message creation failed")
+                mock_logger.error.assert_called_with("Error processing message: %s", mock_mqtt_message.side_effect)
 
     def test_on_subscribe_callback(self, sample_config: ConnectionConfig) -> None:
         """Test subscription confirmation callback."""
@@ -300,7 +291,9 @@ class TestDysonMqttClientCoverage:
             client._on_subscribe(Mock(), None, 123, [0, 1, 2], None)
 
             # Should log subscription confirmation
-            mock_logger.debug.assert_called_with("Subscription confirmed (mid: 123, reason codes: [0, 1, 2])")
+            assert mock_logger.debug.call_args == call(
+                "Subscription confirmed (mid: %s, reason codes: %s)", 123, [0, 1, 2]
+            )
 
     def test_on_publish_callback(self, sample_config: ConnectionConfig) -> None:
         """Test publish confirmation callback."""
@@ -310,7 +303,7 @@ class TestDysonMqttClientCoverage:
             client._on_publish(Mock(), None, 456)
 
             # Should log publish confirmation
-            mock_logger.debug.assert_called_with("Message published (mid: 456)")
+            assert mock_logger.debug.call_args == call("Message published (mid: %s)", 456)
 
     def test_on_log_warning_level(self, sample_config: ConnectionConfig) -> None:
         """Test MQTT log callback with warning level."""
@@ -320,7 +313,17 @@ class TestDysonMqttClientCoverage:
             client._on_log(Mock(), None, mqtt.MQTT_LOG_WARNING, "Warning message")
 
             # Should log as warning
-            mock_logger.warning.assert_called_with("MQTT: Warning message")
+            assert mock_logger.warning.call_args == call("MQTT: %s", "Warning message")
+
+    def test_on_log_error_level(self, sample_config: ConnectionConfig) -> None:
+        """Test MQTT log callback with error level."""
+        client = DysonMqttClient(sample_config)
+
+        with patch("libdyson_mqtt.client.logger") as mock_logger:
+            client._on_log(Mock(), None, mqtt.MQTT_LOG_ERR, "Error message")
+
+            # Should log as error
+            assert mock_logger.error.call_args == call("MQTT: %s", "Error message")
 
     def test_on_log_debug_level(self, sample_config: ConnectionConfig) -> None:
         """Test MQTT log callback with debug level."""
@@ -330,23 +333,127 @@ class TestDysonMqttClientCoverage:
             client._on_log(Mock(), None, mqtt.MQTT_LOG_DEBUG, "Debug message")
 
             # Should log as debug
-            mock_logger.debug.assert_called_with("MQTT: Debug message")
+            assert mock_logger.debug.call_args == call("MQTT: %s", "Debug message")
 
-    def test_publish_with_bytes_payload(self, sample_config: ConnectionConfig) -> None:
+    def test_publish_with_bytes_payload(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
         """Test publish method with bytes payload."""
-        with patch("libdyson_mqtt.client.mqtt.Client") as mock_mqtt_client:
-            mock_client_instance = Mock()
-            mock_mqtt_client.return_value = mock_client_instance
+        client, mock_client_instance = patched_client
 
-            # Mock successful publish
-            mock_client_instance.publish.return_value = (mqtt.MQTT_ERR_SUCCESS, 1)
+        # Test with bytes payload
+        client.publish("test/topic", b"test bytes")
 
-            client = DysonMqttClient(sample_config)
-            client._client = mock_client_instance
-            client._status.connected = True
+        # Should call publish with bytes
+        mock_client_instance.publish.assert_called_once_with("test/topic", b"test bytes", 2, False)
+
+    def test_publish_str_payload_is_encoded_once(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
+        """Test str payloads are handed to the MQTT client already encoded as bytes."""
+        client, mock_client_instance = patched_client
+
+        client.publish("test/topic", "test message")
+
+        payload = mock_client_instance.publish.call_args.args[1]
+        assert isinstance(payload, bytes)
+        assert payload == b"test message"
+
+    def test_publish_with_bytearray_payload(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
+        """Test bytearray payloads are passed through without copying."""
+        client, mock_client_instance = patched_client
+        payload = bytearray(b"test bytes")
+
+        client.publish("test/topic", payload)
+
+        assert mock_client_instance.publish.call_args.args[1] is payload
+
+    @pytest.mark.parametrize("payload", [None, 42, 1.5], ids=["none", "int", "float"])
+    def test_publish_passes_non_dict_payloads_through(
+        self, patched_client: Tuple[DysonMqttClient, MagicMock], payload: Optional[float]
+    ) -> None:
+        """Test None and numeric payloads reach paho unchanged, so None still clears retained messages."""
+        client, mock_client_instance = patched_client
+
+        client.publish("test/topic", payload, retain=True)
+
+        mock_client_instance.publish.assert_called_once_with("test/topic", payload, 2, True)
+
+    def test_publish_many(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
+        """Test publishing a batch of messages."""
+        client, mock_client_instance = patched_client
+
+        client.publish_many(
+            [
+                ("test/topic", "first", 2, False),
+                ("test/other", b"second", 1, True),
+            ]
+        )
+
+        # Should publish each message in order, encoding str payloads
+        assert mock_client_instance.publish.call_args_list == [
+            call("test/topic", b"first", 2, False),
+            call("test/other", b"second", 1, True),
+        ]
+
+    def test_publish_many_stops_on_error(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
+        """Test publish_many stops at the first failed publish."""
+        client, mock_client_instance = patched_client
+
+        # Mock publish to fail on the first message
+        mock_client_instance.publish.return_value = (mqtt.MQTT_ERR_NO_CONN, 1)
+
+        with pytest.raises(TopicError, match="Failed to publish to topic test/topic"):
+            client.publish_many([("test/topic", "first", 2, False), ("test/other", "second", 2, False)])
+
+        mock_client_instance.publish.assert_called_once()
+
+    def test_publish_many_when_not_connected(self, sample_config: ConnectionConfig) -> None:
+        """Test publish_many when not connected raises exception."""
+        client = DysonMqttClient(sample_config)
+
+        with pytest.raises(ClientNotConnectedError):
+            client.publish_many([("test/topic", "test payload", 2, False)])
+
+    def test_publish_with_dict_payload(self, patched_client: Tuple[DysonMqttClient, MagicMock]) -> None:
+        """Test publish method serializes dict payloads to JSON bytes."""
+        client, mock_client_instance = patched_client
+
+        client.publish("test/topic", {"msg": "REQUEST-CURRENT-STATE"})
+
+        # Should call publish with compact JSON bytes
+        mock_client_instance.publish.assert_called_once_with("test/topic", b'{"msg":"REQUEST-CURRENT-STATE"}', 2, False)
+
+    def test_queue_overflow_warns_once(self, sample_config: ConnectionConfig) -> None:
+        """Test a full queue warns once per overflow rather than once per dropped message."""
+        client = DysonMqttClient(sample_config, max_queue_size=1)
+        mock_msg = SimpleNamespace(topic="test/topic", payload=b"test payload", qos=1, retain=False)
+
+        with patch("libdyson_mqtt.client.logger") as mock_logger:
+            for _ in range(3):
+                client._on_message(Mock(), None, mock_msg)
+            mock_logger.warning.assert_called_once()
+
+            # Draining the queue re-arms the warning
+            client.get_messages()
+            for _ in range(2):
+                client._on_message(Mock(), None, mock_msg)
+            assert mock_logger.warning.call_count == 2
+
+        assert client.get_status().dropped_messages == 3
+
+
+class TestJsonSerialization:
+    """Tests that dict payloads serialize the same way with and without orjson."""
+
+    def test_compact_utf8_output(self, json_dumps: Callable[[Any], bytes]) -> None:
+        """Test payloads serialize to compact UTF-8 JSON with non-str keys stringified."""
+        payload = {"msg": "caf\u00e9", 1: [1, 2.5, True, None]}
+
+        assert json_dumps(payload) == '{"msg":"caf\u00e9","1":[1,2.5,true,null]}'.encode("utf-8")
 
-            # Test with bytes payload
-            client.publish("test/topic", b"test bytes")
+    def test_datetime_rejected(self, json_dumps: Callable[[Any], bytes]) -> None:
+        """Test datetimes are rejected by both backends rather than formatted by one of them."""
+        with pytest.raises(TypeError):
+            json_dumps({"time": datetime.now(timezone.utc)})
 
-            # Should call publish with bytes
-            mock_client_instance.publish.assert_called_once_with("test/topic", b"test bytes", 2, False)
+    def test_stdlib_rejects_nan(self) -> None:
+        """Test the stdlib backend refuses to publish NaN as invalid JSON."""
+        with pytest.raises(ValueError):
+            _stdlib_json_dumps({"value": float("nan")})
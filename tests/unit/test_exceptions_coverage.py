@@ -1,5 +1,8 @@
 """Additional tests for exceptions to improve coverage."""
 
+import copy
+import pickle
+
 from libdyson_mqtt.exceptions import AuthenticationError, ConnectionError
 
 
@@ -21,3 +24,11 @@ class TestExceptionsCoverage:
 
         assert str(error) == "Authentication failed"
         assert isinstance(error, DysonMqttError)  # Should inherit from DysonMqttError
+
+    def test_connection_error_pickle_round_trip(self) -> None:
+        """Test ConnectionError keeps its error code through pickle and copy."""
+        error = ConnectionError("Connection failed", error_code=5)
+
+        for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+            assert str(restored) == "Connection failed"
+            assert restored.error_code == 5
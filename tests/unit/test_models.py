@@ -1,6 +1,6 @@
 """Unit tests for the models module."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 
@@ -27,6 +27,7 @@ class TestConnectionConfig:
         assert config.mqtt_topics == ["topic1", "topic2"]
         assert config.port == 1883
         assert config.keepalive == 60
+        assert config.low_latency is False
 
     def test_invalid_empty_host(self) -> None:
         """Test that empty host raises ValueError."""
@@ -104,6 +105,15 @@ class TestMqttMessage:
         assert msg.retain is False
         assert msg.timestamp is not None
         assert isinstance(msg.timestamp, datetime)
+        assert msg.timestamp.tzinfo is timezone.utc
+
+    def test_message_topic_is_interned(self) -> None:
+        """Test equal topics share a single string object."""
+        topic = "".join(["test/", "topic"])
+        msg = MqttMessage(topic=topic, payload=b"test payload", qos=2, retain=False)
+        other = MqttMessage(topic="test/topic", payload=b"test payload", qos=2, retain=False)
+
+        assert msg.topic is other.topic
 
     def test_payload_str_property(self) -> None:
         """Test the payload_str property."""
@@ -111,6 +121,20 @@ class TestMqttMessage:
 
         assert msg.payload_str == "test payload"
 
+    def test_payload_str_is_cached(self) -> None:
+        """Test payload_str is decoded once and then cached."""
+        msg = MqttMessage(topic="test/topic", payload=b"test payload", qos=2, retain=False)
+
+        assert "payload_str" not in msg.__dict__
+        assert msg.payload_str is msg.payload_str
+        assert msg.__dict__["payload_str"] == "test payload"
+
+    def test_to_dict_reuses_cached_payload_str(self) -> None:
+        """Test to_dict returns the cached decoded payload instead of decoding again."""
+        msg = MqttMessage(topic="test/topic", payload=b"test payload", qos=2, retain=False)
+
+        assert msg.to_dict()["payload"] is msg.payload_str
+
     def test_payload_str_with_invalid_utf8(self) -> None:
         """Test payload_str with invalid UTF-8 bytes."""
         msg = MqttMessage(topic="test/topic", payload=b"\xff\xfe", qos=2, retain=False)  # Invalid UTF-8
@@ -135,6 +159,17 @@ class TestMqttMessage:
 
         assert result == expected
 
+    def test_to_dict_is_cached(self) -> None:
+        """Test to_dict builds the dictionary once and returns independent copies."""
+        msg = MqttMessage(topic="test/topic", payload=b"test payload", qos=2, retain=True)
+
+        result = msg.to_dict()
+        result["payload"] = "changed"
+
+        assert msg.to_dict() is not result
+        assert msg.to_dict()["payload"] == "test payload"
+        assert msg.to_dict()["timestamp"] is result["timestamp"]
+
     def test_to_dict_without_timestamp(self) -> None:
         """Test converting message without timestamp to dictionary."""
         msg = MqttMessage(topic="test/topic", payload=b"test payload", qos=2, retain=True)
@@ -145,6 +180,8 @@ class TestMqttMessage:
         assert result["qos"] == 2
         assert result["retain"] is True
         assert result["timestamp"] is not None
+        assert result["timestamp"].endswith("+00:00")
+        assert msg.to_dict()["timestamp"] is result["timestamp"]
 
 
 class TestConnectionStatus:
@@ -159,6 +196,8 @@ class TestConnectionStatus:
         assert status.last_disconnect_time is None
         assert status.connection_attempts == 0
         assert status.last_error is None
+        assert status.last_error_code is None
+        assert status.dropped_messages == 0
 
     def test_status_to_dict(self) -> None:
         """Test converting status to dictionary."""
@@ -174,6 +213,8 @@ class TestConnectionStatus:
             "last_disconnect_time": None,
             "connection_attempts": 3,
             "last_error": "Test error",
+            "last_error_code": None,
+            "dropped_messages": 0,
         }
 
         assert result == expected